@@ -2,6 +2,8 @@
 Check if the code changes are properly saved by inspecting the source files
 """
 
+import ast
+import re
 import sys
 from pathlib import Path
 
@@ -10,37 +12,100 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+_HR = "=" * 60
+
+def compile_markers(checks):
+    """Pair (marker, ok_message, fail_message) checks with one pattern matching any marker"""
+    pattern = re.compile(b"|".join(re.escape(marker) for marker, _, _ in checks))
+    return pattern, checks
+
+# Marker checks per source file, compiled once at import
+MODULE_MANAGER_CHECKS = compile_markers((
+    # Check if it creates in subdirectory
+    (b'module_file = config.usd_directory / "module" / module_type / f"{module_name}.usd"',
+     "create_module creates in type subdirectory",
+     "create_module uses old directory structure"),
+    # Check if it creates parent directory
+    (b"module_type_dir.mkdir(parents=True, exist_ok=True)",
+     "create_module creates parent directories",
+     "create_module doesn't create parent directories"),
+    # Check if it uses save_stage
+    (b"group_utils.save_stage()",
+     "Uses save_stage() method",
+     "Still uses save_changes() method"),
+))
+
+DATA_MANAGER_CHECKS = compile_markers((
+    (b"from .module_manager import ModuleManager",
+     "DataManager imports ModuleManager",
+     "DataManager missing ModuleManager import"),
+    (b"self.module_manager = ModuleManager()",
+     "DataManager creates ModuleManager instance",
+     "DataManager doesn't create ModuleManager"),
+))
+
+def report_markers(content, compiled_checks):
+    """Print a ✅/❌ line for each check, locating all markers in a single scan"""
+    pattern, checks = compiled_checks
+    found = set(pattern.findall(content))
+    
+    for marker, ok_message, fail_message in checks:
+        if marker in found:
+            print(f"✅ {ok_message}")
+        else:
+            print(f"❌ {fail_message}")
+
+# Whitelist type annotation, compared structurally rather than as text
+WHITELIST_ANNOTATION = ast.dump(ast.parse("Dict[str, Dict[str, Any]]", mode="eval").body)
+
+def check_usd_group_utils_signatures(source):
+    """Check the USDGroupUtils whitelist method signatures from the parsed source"""
+    tree = ast.parse(source)
+    methods = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "USDGroupUtils":
+            methods = {item.name: item for item in node.body if isinstance(item, ast.FunctionDef)}
+    
+    # Check if the new method signature exists
+    get_whitelist = methods.get("get_module_whitelist")
+    if get_whitelist:
+        args = get_whitelist.args
+        optional_args = [arg.arg for arg in args.args[len(args.args) - len(args.defaults):]]
+    else:
+        optional_args = []
+    
+    if "module_type" in optional_args:
+        print("✅ get_module_whitelist has optional module_type parameter")
+    else:
+        print("❌ get_module_whitelist still has old signature")
+    
+    # Check if it returns Dict
+    if get_whitelist and get_whitelist.returns and ast.dump(get_whitelist.returns) == WHITELIST_ANNOTATION:
+        print("✅ get_module_whitelist returns correct type")
+    else:
+        print("❌ get_module_whitelist has wrong return type")
+    
+    # Check if set_module_whitelist takes Dict
+    set_whitelist = methods.get("set_module_whitelist")
+    annotations = {arg.arg: arg.annotation for arg in set_whitelist.args.args} if set_whitelist else {}
+    whitelist_arg = annotations.get("module_whitelist")
+    if whitelist_arg is not None and ast.dump(whitelist_arg) == WHITELIST_ANNOTATION:
+        print("✅ set_module_whitelist takes Dict parameter")
+    else:
+        print("❌ set_module_whitelist has old signature")
+
 def check_code_changes():
     """Check if the key fixes are in the source files"""
-    print("="*60)
+    print(_HR)
     print("CHECK: Code Changes in Source Files")
-    print("="*60)
+    print(_HR)
     
     # Check 1: USDGroupUtils get_module_whitelist method
     print("🔍 Checking USDGroupUtils.get_module_whitelist...")
     usd_utils_file = Path("hair_qc_tool/utils/usd_utils.py")
     
     if usd_utils_file.exists():
-        with open(usd_utils_file, 'r') as f:
-            content = f.read()
-            
-        # Check if the new method signature exists
-        if "def get_module_whitelist(self, module_type: str = None)" in content:
-            print("✅ get_module_whitelist has optional module_type parameter")
-        else:
-            print("❌ get_module_whitelist still has old signature")
-            
-        # Check if it returns Dict
-        if "-> Dict[str, Dict[str, Any]]:" in content:
-            print("✅ get_module_whitelist returns correct type")
-        else:
-            print("❌ get_module_whitelist has wrong return type")
-            
-        # Check if set_module_whitelist takes Dict
-        if "def set_module_whitelist(self, module_whitelist: Dict[str, Dict[str, Any]]):" in content:
-            print("✅ set_module_whitelist takes Dict parameter")
-        else:
-            print("❌ set_module_whitelist has old signature")
+        check_usd_group_utils_signatures(usd_utils_file.read_bytes())
     else:
         print("❌ usd_utils.py not found")
     
@@ -49,26 +114,7 @@ def check_code_changes():
     module_manager_file = Path("hair_qc_tool/managers/module_manager.py")
     
     if module_manager_file.exists():
-        with open(module_manager_file, 'r') as f:
-            content = f.read()
-            
-        # Check if it creates in subdirectory
-        if 'module_file = config.usd_directory / "module" / module_type / f"{module_name}.usd"' in content:
-            print("✅ create_module creates in type subdirectory")
-        else:
-            print("❌ create_module uses old directory structure")
-            
-        # Check if it creates parent directory
-        if "module_type_dir.mkdir(parents=True, exist_ok=True)" in content:
-            print("✅ create_module creates parent directories")
-        else:
-            print("❌ create_module doesn't create parent directories")
-            
-        # Check if it uses save_stage
-        if "group_utils.save_stage()" in content:
-            print("✅ Uses save_stage() method")
-        else:
-            print("❌ Still uses save_changes() method")
+        report_markers(module_manager_file.read_bytes(), MODULE_MANAGER_CHECKS)
     else:
         print("❌ module_manager.py not found")
     
@@ -77,24 +123,13 @@ def check_code_changes():
     data_manager_file = Path("hair_qc_tool/managers/data_manager.py")
     
     if data_manager_file.exists():
-        with open(data_manager_file, 'r') as f:
-            content = f.read()
-            
-        if "from .module_manager import ModuleManager" in content:
-            print("✅ DataManager imports ModuleManager")
-        else:
-            print("❌ DataManager missing ModuleManager import")
-            
-        if "self.module_manager = ModuleManager()" in content:
-            print("✅ DataManager creates ModuleManager instance")
-        else:
-            print("❌ DataManager doesn't create ModuleManager")
+        report_markers(data_manager_file.read_bytes(), DATA_MANAGER_CHECKS)
     else:
         print("❌ data_manager.py not found")
     
-    print("\n" + "="*60)
+    print(f"\n{_HR}")
     print("SUMMARY")
-    print("="*60)
+    print(_HR)
     print("If all checks show ✅, then the code changes are saved.")
     print("If you see ❌, the old code might still be cached in Maya.")
     print("\nTo fix Maya caching:")
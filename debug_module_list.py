@@ -3,6 +3,7 @@ Debug script to understand why modules aren't showing in the list
 """
 
 import sys
+import traceback
 from pathlib import Path
 
 # Add hair_qc_tool to path
@@ -10,16 +11,20 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+from script_helpers import SHOW_TRACEBACKS, buffered_output, cached_module_whitelist, scan_module_dirs
+
+_HR = "=" * 60
+
+@buffered_output
 def debug_module_listing():
     """Debug the module listing process step by step"""
-    print("="*60)
+    print(_HR)
     print("DEBUG: Module Listing Process")
-    print("="*60)
+    print(_HR)
     
     try:
         from hair_qc_tool.managers import DataManager
         from hair_qc_tool.config import config
-        from hair_qc_tool.utils import USDGroupUtils
         
         # Check USD directory
         if not config.usd_directory:
@@ -42,11 +47,9 @@ def debug_module_listing():
         
         if module_dir.exists():
             print(f"✅ Module subdirectories:")
-            for subdir in ["scalp", "crown", "tail", "bang"]:
-                subdir_path = module_dir / subdir
-                if subdir_path.exists():
-                    module_files = list(subdir_path.glob("*.usd"))
-                    print(f"  - {subdir}: {[f.stem for f in module_files]}")
+            for subdir, module_names in scan_module_dirs(module_dir).items():
+                if module_names is not None:
+                    print(f"  - {subdir}: {module_names}")
                 else:
                     print(f"  - {subdir}: directory doesn't exist")
         
@@ -87,8 +90,7 @@ def debug_module_listing():
         
         if group_file.exists():
             try:
-                group_utils = USDGroupUtils(group_file)
-                module_whitelist = group_utils.get_module_whitelist()
+                module_whitelist = cached_module_whitelist(group_file)
                 print(f"✅ Module whitelist from group: {module_whitelist}")
                 
                 if not module_whitelist:
@@ -98,9 +100,9 @@ def debug_module_listing():
                 else:
                     print(f"✅ Group has {len(module_whitelist)} modules in whitelist")
             except Exception as e:
-                print(f"❌ Error reading group module whitelist: {e}")
-                import traceback
-                traceback.print_exc()
+                print(f"❌ Error reading group module whitelist: {type(e).__name__}: {e}")
+                if SHOW_TRACEBACKS:
+                    traceback.print_exc(file=sys.stdout)
         
         # Test getting available modules
         print(f"\n" + "="*40)
@@ -119,9 +121,9 @@ def debug_module_listing():
             print("❌ PROBLEM CONFIRMED: No modules found by either method!")
         
     except Exception as e:
-        print(f"❌ Debug failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Debug failed with error: {type(e).__name__}: {e}")
+        if SHOW_TRACEBACKS:
+            traceback.print_exc(file=sys.stdout)
 
 if __name__ == "__main__":
     debug_module_listing()
\ No newline at end of file
@@ -3,6 +3,7 @@ Simplified debug script to test module listing without Maya
 """
 
 import sys
+import traceback
 from pathlib import Path
 
 # Add hair_qc_tool to path
@@ -10,15 +11,19 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+from script_helpers import SHOW_TRACEBACKS, buffered_output, cached_module_whitelist, scan_module_dirs
+
+_HR = "=" * 60
+
+@buffered_output
 def debug_module_listing_simple():
     """Debug the module listing process without Maya dependencies"""
-    print("="*60)
+    print(_HR)
     print("DEBUG: Module Listing (No Maya)")
-    print("="*60)
+    print(_HR)
     
     try:
         from hair_qc_tool.config import config
-        from hair_qc_tool.utils import USDGroupUtils
         
         # Check USD directory
         if not config.usd_directory:
@@ -41,11 +46,9 @@ def debug_module_listing_simple():
         
         if module_dir.exists():
             print(f"✅ Module subdirectories:")
-            for subdir in ["scalp", "crown", "tail", "bang"]:
-                subdir_path = module_dir / subdir
-                if subdir_path.exists():
-                    module_files = list(subdir_path.glob("*.usd"))
-                    print(f"  - {subdir}: {[f.stem for f in module_files]}")
+            for subdir, module_names in scan_module_dirs(module_dir).items():
+                if module_names is not None:
+                    print(f"  - {subdir}: {module_names}")
                 else:
                     print(f"  - {subdir}: directory doesn't exist")
         
@@ -61,8 +64,7 @@ def debug_module_listing_simple():
                 print(f"✅ Group file: {group_file}")
                 
                 try:
-                    group_utils = USDGroupUtils(group_file)
-                    module_whitelist = group_utils.get_module_whitelist()
+                    module_whitelist = cached_module_whitelist(group_file)
                     print(f"✅ Module whitelist: {module_whitelist}")
                     
                     if not module_whitelist:
@@ -73,14 +75,14 @@ def debug_module_listing_simple():
                             print(f"  - {mod_name}: {mod_info}")
                             
                 except Exception as e:
-                    print(f"❌ Error reading group {group_name}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    print(f"❌ Error reading group {group_name}: {type(e).__name__}: {e}")
+                    if SHOW_TRACEBACKS:
+                        traceback.print_exc(file=sys.stdout)
         
     except Exception as e:
-        print(f"❌ Debug failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Debug failed with error: {type(e).__name__}: {e}")
+        if SHOW_TRACEBACKS:
+            traceback.print_exc(file=sys.stdout)
 
 if __name__ == "__main__":
     debug_module_listing_simple()
\ No newline at end of file
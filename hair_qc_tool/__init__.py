@@ -8,18 +8,28 @@ Supports group-based organization, cross-module blendshape rules, and automated
 __version__ = "1.0.0"
 __author__ = "Hair QC Tool Development"
 
-# Import main components for easy access (only when Maya is available)
 try:
     import maya.cmds
-    # Maya is available, import Maya-dependent components
-    from .main import launch_hair_qc_tool
     MAYA_AVAILABLE = True
 except ImportError:
-    # Maya not available, define stub function
-    def launch_hair_qc_tool():
-        raise RuntimeError("Maya is required to launch the Hair QC Tool")
     MAYA_AVAILABLE = False
 
+def __getattr__(name):
+    """Import launch_hair_qc_tool on first access so importing the package stays cheap"""
+    if name != "launch_hair_qc_tool":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    if MAYA_AVAILABLE:
+        # Pulls in the UI, managers and USD utilities
+        from .main import launch_hair_qc_tool
+    else:
+        # Maya not available, define stub function
+        def launch_hair_qc_tool():
+            raise RuntimeError("Maya is required to launch the Hair QC Tool")
+    
+    globals()[name] = launch_hair_qc_tool
+    return launch_hair_qc_tool
+
 # Config is always available
 from .config import HairQCConfig
 
@@ -9,6 +9,100 @@ import json
 from pathlib import Path
 
 
+# Basic group USD structure written by initialize_usd_directory;
+# __GROUP_NAME__ is replaced with each sample group's name
+_SAMPLE_GROUP_TEMPLATE = '''#usda 1.0
+(
+    doc = "Sample __GROUP_NAME__ hair group"
+    metersPerUnit = 1
+    upAxis = "Y"
+)
+
+def "HairGroup" (
+    variants = {
+        string groupType = "__GROUP_NAME__"
+    }
+)
+{
+    # Module whitelist - modules included in this group
+    def "ModuleWhitelist" {
+        def "Crown" {
+            asset[] moduleFiles = []
+        }
+        
+        def "Tail" {
+            asset[] moduleFiles = []
+        }
+        
+        def "Bang" {
+            asset[] moduleFiles = []
+        }
+        
+        def "Scalp" {
+            asset[] moduleFiles = [@module/scalp/scalp.usd@]
+        }
+    }
+    
+    # Alpha texture whitelist for this group
+    def "AlphaWhitelist" {
+        def "Scalp" {
+            def "fade" {
+                asset[] whitelistedTextures = []
+            }
+            
+            def "hairline" {
+                asset[] whitelistedTextures = []
+            }
+            
+            def "sideburn" {
+                asset[] whitelistedTextures = []
+            }
+        }
+    }
+    
+    # Cross-module rules storage
+    def "CrossModuleRules" {
+        def "Exclusions" {
+            # Cross-module exclusions will be stored here
+        }
+        
+        def "WeightConstraints" {
+            # Cross-module weight constraints will be stored here
+        }
+    }
+}
+'''
+
+_USD_DIRECTORY_README = '''# Hair QC Tool USD Directory
+
+This directory has been initialized for use with the Hair QC Tool.
+
+## Directory Structure
+
+- **Group/**: Contains group USD files that define module collections and QC boundaries
+- **module/**: Contains individual module USD files organized by type
+  - **scalp/**: Scalp modules with alpha texture directories
+  - **crown/**: Crown hair modules  
+  - **tail/**: Tail/ponytail modules
+  - **bang/**: Bang/fringe modules
+- **style/**: Contains style USD files that combine modules with animation data
+
+## Getting Started
+
+1. Create modules using the Hair QC Tool's Module tab
+2. Generate style combinations using the Style tab
+3. Set up QC rules and exclusions for quality control
+4. Export animation timelines for testing
+
+## Sample Files
+
+- `Group/short.usd` and `Group/long.usd` are sample group files
+- Add your own groups as needed for different hair categories
+
+For more information, see the Hair QC Tool documentation.
+'''
+
+
 class HairQCConfig:
     """Configuration manager for Hair QC Tool"""
     
@@ -23,9 +117,26 @@ class HairQCConfig:
         "show_debug_info": False
     }
     
+    # Deepest directories of an initialized USD directory
+    USD_DIRECTORY_LEAVES = (
+        "Group",
+        "style",
+        "module/scalp/alpha/fade",
+        "module/scalp/alpha/hairline",
+        "module/scalp/alpha/sideburn",
+        "module/scalp/normal",
+        "module/crown/normal",
+        "module/tail/normal",
+        "module/bang/normal",
+    )
+    
     def __init__(self):
         self.config_file = Path.home() / ".hair_qc_tool_config.json"
         self._config = self.DEFAULT_CONFIG.copy()
+        # ((usd_directory, root st_mtime_ns), result) of the last validation
+        self._validation_cache = None
+        # Path form of _config["usd_directory"], rebuilt only when the string changes
+        self._usd_path = None
         self.load_config()
     
     def load_config(self):
@@ -35,6 +146,7 @@ class HairQCConfig:
                 with open(self.config_file, 'r') as f:
                     saved_config = json.load(f)
                     self._config.update(saved_config)
+                    self._update_usd_path()
                     print(f"[Hair QC Tool] Config loaded from {self.config_file}")
         except Exception as e:
             print(f"[Hair QC Tool] Warning: Could not load config: {e}")
@@ -42,23 +154,35 @@ class HairQCConfig:
     def save_config(self):
         """Save current configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
+            # Write to a temporary file and swap it in so a failed write
+            # never leaves a truncated config behind
+            temp_file = self.config_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
                 json.dump(self._config, f, indent=2)
-                print(f"[Hair QC Tool] Config saved to {self.config_file}")
+            os.replace(temp_file, self.config_file)
+            print(f"[Hair QC Tool] Config saved to {self.config_file}")
         except Exception as e:
             print(f"[Hair QC Tool] Error: Could not save config: {e}")
     
     @property
     def usd_directory(self):
         """Get USD directory path"""
-        return Path(self._config["usd_directory"]) if self._config["usd_directory"] else None
+        return self._usd_path
     
     @usd_directory.setter
     def usd_directory(self, path):
         """Set USD directory path"""
-        self._config["usd_directory"] = str(path) if path else ""
+        value = str(path) if path else ""
+        if self._config["usd_directory"] == value:
+            return
+        self._config["usd_directory"] = value
+        self._update_usd_path()
         self.save_config()
     
+    def _update_usd_path(self):
+        """Rebuild the cached USD directory Path from the stored string"""
+        self._usd_path = Path(self._config["usd_directory"]) if self._config["usd_directory"] else None
+    
     @property
     def max_timeline_frames(self):
         """Maximum frames allowed in timeline"""
@@ -75,29 +199,62 @@ class HairQCConfig:
     
     def set(self, key, value):
         """Set configuration value and save"""
+        if key in self._config and self._config[key] == value:
+            return
         self._config[key] = value
+        if key == "usd_directory":
+            self._update_usd_path()
         self.save_config()
     
     def validate_usd_directory(self):
         """Validate that USD directory exists and has expected structure"""
-        if not self.usd_directory:
+        usd_directory = self.usd_directory
+        if not usd_directory:
             return False, "No USD directory set"
         
-        if not self.usd_directory.exists():
-            return False, f"USD directory does not exist: {self.usd_directory}"
+        # Adding or removing top-level entries bumps the root's mtime, so an
+        # unchanged mtime means the previous result still holds
+        try:
+            cache_key = (self._config["usd_directory"], os.stat(usd_directory).st_mtime_ns)
+        except OSError:
+            cache_key = None
+        
+        if cache_key is not None and self._validation_cache and self._validation_cache[0] == cache_key:
+            return self._validation_cache[1]
+        
+        result = self._check_usd_directory_structure(usd_directory)
+        
+        # Failures (unreadable directory, missing folders) are always rechecked;
+        # a permission fix, for one, doesn't touch the mtime
+        if cache_key is not None and result[0] in (True, "empty"):
+            self._validation_cache = (cache_key, result)
+        else:
+            self._validation_cache = None
+        return result
+    
+    def invalidate_validation_cache(self):
+        """Force the next validate_usd_directory call to rescan the directory"""
+        self._validation_cache = None
+    
+    def _check_usd_directory_structure(self, usd_directory):
+        """Scan the USD directory and report whether it has the expected structure"""
+        # List the directory once; existence, subdirectories and emptiness
+        # all come from the same scan
+        try:
+            with os.scandir(usd_directory) as it:
+                entries = {entry.name: entry.is_dir() for entry in it}
+        except FileNotFoundError:
+            return False, f"USD directory does not exist: {usd_directory}"
+        except OSError as e:
+            return False, f"Could not read USD directory: {e}"
         
         # Check for expected subdirectories
         required_dirs = ["Group", "module", "style"]
-        missing_dirs = []
-        
-        for dir_name in required_dirs:
-            dir_path = self.usd_directory / dir_name
-            if not dir_path.exists():
-                missing_dirs.append(dir_name)
+        missing_dirs = [dir_name for dir_name in required_dirs if not entries.get(dir_name)]
         
         if missing_dirs:
             # Check if directory is completely empty
-            if self.is_directory_empty():
+            if not entries:
                 return "empty", f"Directory is empty. Would you like to initialize it with the required USD structure?"
             else:
                 return False, f"Missing required directories: {', '.join(missing_dirs)}"
@@ -106,13 +263,16 @@ class HairQCConfig:
     
     def is_directory_empty(self):
         """Check if the USD directory is completely empty"""
-        if not self.usd_directory or not self.usd_directory.exists():
+        usd_directory = self.usd_directory
+        if not usd_directory:
             return True
         
-        # Check if directory has any files or folders
+        # Check if directory has any files or folders (stop at the first entry);
+        # a missing directory raises and counts as empty
         try:
-            return len(list(self.usd_directory.iterdir())) == 0
-        except:
+            with os.scandir(usd_directory) as entries:
+                return next(entries, None) is None
+        except OSError:
             return True
     
     def initialize_usd_directory(self):
@@ -121,36 +281,10 @@ class HairQCConfig:
             return False, "No USD directory set"
         
         try:
-            # Create required directories
-            required_structure = {
-                "Group": [],
-                "module": ["scalp", "crown", "tail", "bang"],
-                "style": []
-            }
-            
-            for main_dir, subdirs in required_structure.items():
-                main_path = self.usd_directory / main_dir
-                main_path.mkdir(exist_ok=True)
-                
-                for subdir in subdirs:
-                    sub_path = main_path / subdir
-                    sub_path.mkdir(exist_ok=True)
-                    
-                    # Create alpha directories for scalp
-                    if subdir == "scalp":
-                        alpha_dirs = ["fade", "hairline", "sideburn"]
-                        alpha_path = sub_path / "alpha"
-                        alpha_path.mkdir(exist_ok=True)
-                        
-                        for alpha_dir in alpha_dirs:
-                            (alpha_path / alpha_dir).mkdir(exist_ok=True)
-                        
-                        # Create normal directory
-                        (sub_path / "normal").mkdir(exist_ok=True)
-                    
-                    # Create normal directories for other modules
-                    elif subdir in ["crown", "tail", "bang"]:
-                        (sub_path / "normal").mkdir(exist_ok=True)
+            # Create required directories (makedirs fills in the parents)
+            root = str(self.usd_directory)
+            for leaf_dir in self.USD_DIRECTORY_LEAVES:
+                os.makedirs(os.path.join(root, leaf_dir), exist_ok=True)
             
             # Create sample group files
             self._create_sample_group_files()
@@ -158,6 +292,8 @@ class HairQCConfig:
             # Create README file
             self._create_readme_file()
             
+            self.invalidate_validation_cache()
+            
             print(f"[Hair QC Tool] Initialized USD directory structure at: {self.usd_directory}")
             return True, "USD directory initialized successfully"
             
@@ -167,111 +303,37 @@ class HairQCConfig:
     def _create_sample_group_files(self):
         """Create sample group USD files"""
         sample_groups = ["short", "long"]
+        group_dir = self.usd_directory / "Group"
         
         for group_name in sample_groups:
-            group_file = self.usd_directory / "Group" / f"{group_name}.usd"
-            
-            # Create basic group USD structure
-            group_content = f'''#usda 1.0
-(
-    doc = "Sample {group_name} hair group"
-    metersPerUnit = 1
-    upAxis = "Y"
-)
-
-def "HairGroup" (
-    variants = {{
-        string groupType = "{group_name}"
-    }}
-)
-{{
-    # Module whitelist - modules included in this group
-    def "ModuleWhitelist" {{
-        def "Crown" {{
-            asset[] moduleFiles = []
-        }}
-        
-        def "Tail" {{
-            asset[] moduleFiles = []
-        }}
-        
-        def "Bang" {{
-            asset[] moduleFiles = []
-        }}
-        
-        def "Scalp" {{
-            asset[] moduleFiles = [@module/scalp/scalp.usd@]
-        }}
-    }}
-    
-    # Alpha texture whitelist for this group
-    def "AlphaWhitelist" {{
-        def "Scalp" {{
-            def "fade" {{
-                asset[] whitelistedTextures = []
-            }}
-            
-            def "hairline" {{
-                asset[] whitelistedTextures = []
-            }}
-            
-            def "sideburn" {{
-                asset[] whitelistedTextures = []
-            }}
-        }}
-    }}
-    
-    # Cross-module rules storage
-    def "CrossModuleRules" {{
-        def "Exclusions" {{
-            # Cross-module exclusions will be stored here
-        }}
-        
-        def "WeightConstraints" {{
-            # Cross-module weight constraints will be stored here
-        }}
-    }}
-}}
-'''
-            
-            with open(group_file, 'w') as f:
-                f.write(group_content)
+            group_file = group_dir / f"{group_name}.usd"
+            group_file.write_text(_SAMPLE_GROUP_TEMPLATE.replace("__GROUP_NAME__", group_name))
     
     def _create_readme_file(self):
         """Create README file explaining the directory structure"""
-        readme_content = '''# Hair QC Tool USD Directory
-
-This directory has been initialized for use with the Hair QC Tool.
-
-## Directory Structure
-
-- **Group/**: Contains group USD files that define module collections and QC boundaries
-- **module/**: Contains individual module USD files organized by type
-  - **scalp/**: Scalp modules with alpha texture directories
-  - **crown/**: Crown hair modules  
-  - **tail/**: Tail/ponytail modules
-  - **bang/**: Bang/fringe modules
-- **style/**: Contains style USD files that combine modules with animation data
-
-## Getting Started
-
-1. Create modules using the Hair QC Tool's Module tab
-2. Generate style combinations using the Style tab
-3. Set up QC rules and exclusions for quality control
-4. Export animation timelines for testing
+        readme_file = self.usd_directory / "README.md"
+        readme_file.write_text(_USD_DIRECTORY_README)
 
-## Sample Files
 
-- `Group/short.usd` and `Group/long.usd` are sample group files
-- Add your own groups as needed for different hair categories
-
-For more information, see the Hair QC Tool documentation.
-'''
-        
-        readme_file = self.usd_directory / "README.md"
-        with open(readme_file, 'w') as f:
-            f.write(readme_content)
+class _LazyConfig:
+    """Stand-in for the global HairQCConfig that reads the config file on first use"""
+    
+    __slots__ = ("_instance",)
+    
+    def __init__(self):
+        object.__setattr__(self, "_instance", None)
+    
+    def _get_instance(self):
+        if self._instance is None:
+            object.__setattr__(self, "_instance", HairQCConfig())
+        return self._instance
+    
+    def __getattr__(self, name):
+        return getattr(self._get_instance(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._get_instance(), name, value)
 
 
-# Global config instance
-config = HairQCConfig()
\ No newline at end of file
+# Global config instance (loaded lazily so importing the tool doesn't touch disk)
+config = _LazyConfig()
\ No newline at end of file
@@ -6,13 +6,12 @@ Handles Maya integration, UI launching, and tool lifecycle management.
 
 import maya.cmds as cmds
 import maya.mel as mel
-from PySide2 import QtWidgets
+import logging
 import sys
-import traceback
 
-from .ui.main_window import HairQCMainWindow
 from .config import config
-from .utils.maya_utils import MayaUtils
+
+logger = logging.getLogger(__name__)
 
 
 class HairQCTool:
@@ -20,7 +19,15 @@ class HairQCTool:
     
     def __init__(self):
         self.main_window = None
-        self.maya_utils = MayaUtils()
+        self._maya_utils = None
+    
+    @property
+    def maya_utils(self):
+        """MayaUtils instance, created on first use"""
+        if self._maya_utils is None:
+            from .utils.maya_utils import MayaUtils
+            self._maya_utils = MayaUtils()
+        return self._maya_utils
     
     def launch(self):
         """Launch the Hair QC Tool UI"""
@@ -40,7 +47,9 @@ class HairQCTool:
                 self._show_setup_dialog(message)
                 return
             
-            # Create and show main window
+            # Create and show main window (the UI pulls in PySide2 and the
+            # managers, so it is only imported once the tool is opened)
+            from .ui.main_window import HairQCMainWindow
             self.main_window = HairQCMainWindow()
             self.main_window.show()
             
@@ -48,8 +57,7 @@ class HairQCTool:
             
         except Exception as e:
             error_msg = f"Failed to launch Hair QC Tool: {str(e)}"
-            print(f"[Hair QC Tool] Error: {error_msg}")
-            traceback.print_exc()
+            logger.exception("[Hair QC Tool] Error: %s", error_msg)
             
             # Show error dialog
             cmds.confirmDialog(
@@ -111,6 +119,7 @@ class HairQCTool:
         directory = cmds.fileDialog2(
             caption="Select USD Directory",
             fileMode=3,  # Directory mode
+            dialogStyle=2,  # Maya's Qt dialog; the native one can stall on slow shares
             okCaption="Select"
         )
         
@@ -118,7 +127,9 @@ class HairQCTool:
             config.usd_directory = directory[0]
             print(f"[Hair QC Tool] USD directory set to: {config.usd_directory}")
             
-            # Validate and launch if valid
+            # Validate and launch if valid (always rescan a directory the
+            # user has just picked)
+            config.invalidate_validation_cache()
             validation_result, message = config.validate_usd_directory()
             if validation_result == True:
                 self.launch()
@@ -135,6 +146,14 @@ class HairQCTool:
 # Global tool instance
 _hair_qc_tool = None
 
+# Menu item labels installed by this copy of the module (None until installed);
+# a reload re-imports the module and so rebuilds the menu with fresh callbacks
+_MENU_ITEM_LABELS = ("Open Hair QC Tool", "Refresh Data", "Settings")
+_installed_menu_items = None
+
+_SHELF_BUTTON_LABEL = "Hair QC"
+_SHELF_BUTTON_COMMAND = "from hair_qc_tool import launch_hair_qc_tool; launch_hair_qc_tool()"
+
 
 def launch_hair_qc_tool():
     """Public function to launch Hair QC Tool"""
@@ -146,9 +165,28 @@ def launch_hair_qc_tool():
     _hair_qc_tool.launch()
 
 
+# Menu callbacks (Maya passes the item's checked state, which is ignored)
+def _on_open_tool_clicked(*_):
+    launch_hair_qc_tool()
+
+
+def _on_refresh_data_clicked(*_):
+    refresh_tool_data()
+
+
+def _on_settings_clicked(*_):
+    show_settings_dialog()
+
+
 def install_maya_menu():
     """Install Hair QC Tool in Maya's main menu bar"""
+    global _installed_menu_items
+    
     try:
+        # Nothing to do if this module already installed the same menu
+        if cmds.menu("HairQCMenu", exists=True) and _installed_menu_items == _MENU_ITEM_LABELS:
+            return
+        
         # Remove existing menu if it exists
         if cmds.menu("HairQCMenu", exists=True):
             cmds.deleteUI("HairQCMenu", menu=True)
@@ -164,7 +202,7 @@ def install_maya_menu():
         # Add menu items
         cmds.menuItem(
             label="Open Hair QC Tool",
-            command=lambda x: launch_hair_qc_tool(),
+            command=_on_open_tool_clicked,
             annotation="Launch the Hair QC Tool",
             parent=main_menu
         )
@@ -173,22 +211,23 @@ def install_maya_menu():
         
         cmds.menuItem(
             label="Refresh Data",
-            command=lambda x: refresh_tool_data(),
+            command=_on_refresh_data_clicked,
             annotation="Refresh USD data (F5)",
             parent=main_menu
         )
         
         cmds.menuItem(
             label="Settings",
-            command=lambda x: show_settings_dialog(),
+            command=_on_settings_clicked,
             annotation="Open Hair QC Tool settings",
             parent=main_menu
         )
         
+        _installed_menu_items = _MENU_ITEM_LABELS
         print("[Hair QC Tool] Menu installed successfully")
         
     except Exception as e:
-        print(f"[Hair QC Tool] Error installing menu: {e}")
+        logger.exception("[Hair QC Tool] Error installing menu: %s", e)
 
 
 def create_shelf_button():
@@ -198,11 +237,19 @@ def create_shelf_button():
         shelf_top_level = mel.eval('$tempVar = $gShelfTopLevel')
         current_shelf = cmds.tabLayout(shelf_top_level, query=True, selectTab=True)
         
+        # Don't add a duplicate if the shelf already has our button
+        for child in cmds.shelfLayout(current_shelf, query=True, childArray=True) or []:
+            if (cmds.objectTypeUI(child) == "shelfButton"
+                    and cmds.shelfButton(child, query=True, label=True) == _SHELF_BUTTON_LABEL
+                    and cmds.shelfButton(child, query=True, command=True) == _SHELF_BUTTON_COMMAND):
+                print("[Hair QC Tool] Shelf button already exists")
+                return
+        
         # Create shelf button
         cmds.shelfButton(
-            command="from hair_qc_tool import launch_hair_qc_tool; launch_hair_qc_tool()",
+            command=_SHELF_BUTTON_COMMAND,
             annotation="Launch Hair QC Tool",
-            label="Hair QC",
+            label=_SHELF_BUTTON_LABEL,
             image="polyCreateFacet.png",  # Default Maya icon, can be customized
             parent=current_shelf
         )
@@ -210,16 +257,37 @@ def create_shelf_button():
         print("[Hair QC Tool] Shelf button created successfully")
         
     except Exception as e:
-        print(f"[Hair QC Tool] Error creating shelf button: {e}")
+        logger.exception("[Hair QC Tool] Error creating shelf button: %s", e)
+
+
+# Calls to refresh_tool_data within this window collapse into one refresh
+_REFRESH_DEBOUNCE_MS = 100
+_refresh_timer = None
 
 
 def refresh_tool_data():
     """Refresh tool data - called by F5 shortcut"""
-    global _hair_qc_tool
+    global _hair_qc_tool, _refresh_timer
+    if not (_hair_qc_tool and _hair_qc_tool.main_window):
+        print("[Hair QC Tool] No active tool window to refresh")
+        return
+    
+    # The window exists, so PySide2 is already loaded
+    from PySide2 import QtCore
+    
+    if _refresh_timer is None:
+        _refresh_timer = QtCore.QTimer()
+        _refresh_timer.setSingleShot(True)
+        _refresh_timer.timeout.connect(_run_pending_refresh)
+    
+    # Restarts the countdown if a refresh is already pending
+    _refresh_timer.start(_REFRESH_DEBOUNCE_MS)
+
+
+def _run_pending_refresh():
+    """Perform the refresh scheduled by refresh_tool_data"""
     if _hair_qc_tool and _hair_qc_tool.main_window:
         _hair_qc_tool.main_window.refresh_data()
-    else:
-        print("[Hair QC Tool] No active tool window to refresh")
 
 
 def show_settings_dialog():
@@ -4,8 +4,23 @@ Manager modules for Hair QC Tool
 Provides high-level management interfaces for Groups, Modules, and Styles.
 """
 
-from .group_manager import GroupManager
-from .module_manager import ModuleManager
-from .data_manager import DataManager
+import importlib
 
-__all__ = ['GroupManager', 'ModuleManager', 'DataManager']
\ No newline at end of file
+# Managers are imported on first access so importing the package (or one
+# manager) doesn't load the others
+_MANAGER_MODULES = {
+    'GroupManager': '.group_manager',
+    'ModuleManager': '.module_manager',
+    'DataManager': '.data_manager',
+}
+
+__all__ = ['GroupManager', 'ModuleManager', 'DataManager']
+
+def __getattr__(name):
+    """Import a manager class the first time it is requested"""
+    if name not in _MANAGER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    manager_class = getattr(importlib.import_module(_MANAGER_MODULES[name], __name__), name)
+    globals()[name] = manager_class
+    return manager_class
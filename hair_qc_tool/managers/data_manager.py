@@ -5,12 +5,30 @@ Coordinates between Group, Module, and Style managers.
 Provides a unified interface for the UI to interact with USD data.
 """
 
-from typing import Optional, List, Dict, Tuple, Any
+import os
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, List, Dict, Mapping, Tuple, Union, Any
 from pathlib import Path
 
 from ..config import config
-from .group_manager import GroupManager
-from .module_manager import ModuleManager
+
+# GroupManager is imported when the group manager is first used. ModuleManager,
+# and through its module-level imports the USD utilities, still load as soon
+# as a DataManager is created
+if TYPE_CHECKING:
+    from .group_manager import GroupManager
+
+
+def _mtime_signature(paths: List[Union[str, Path]]) -> Tuple[Tuple[str, int], ...]:
+    """Pair each path with its st_mtime_ns (0 if missing) to detect directory changes"""
+    signature = []
+    for path in paths:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        signature.append((str(path), mtime))
+    return tuple(signature)
 
 
 class DataManager:
@@ -21,19 +39,59 @@ class DataManager:
     change tracking, and unified operations.
     """
     
+    # Unsaved-change flags, one bit per category
+    _GROUP_CHANGED = 1
+    _MODULES_CHANGED = 2
+    _STYLES_CHANGED = 4
+    _CATEGORY_BITS = {
+        'group': _GROUP_CHANGED,
+        'modules': _MODULES_CHANGED,
+        'styles': _STYLES_CHANGED
+    }
+    
     def __init__(self):
-        self.group_manager = GroupManager()
+        from .module_manager import ModuleManager
+        
+        self._group_manager: Optional["GroupManager"] = None
         self.module_manager = ModuleManager()
-        self._change_tracking: Dict[str, bool] = {
-            'group': False,
-            'modules': False,
-            'styles': False
-        }
+        self._unsaved_changes = 0
+        # Bumped on every load, edit or save; results derived from the
+        # loaded data are cached against it
+        self._data_revision = 0
         
         # Cache for UI data
-        self._cached_groups: Optional[List[str]] = None
+        self._cached_groups: Optional[Tuple[str, ...]] = None
         self._cached_modules: Optional[List[str]] = None
+        self._modules_signature: Optional[Tuple[Tuple[str, int], ...]] = None
         self._cache_valid = False
+        
+        # Last get_status_summary result and the state it was built from
+        self._status_cache_key: Optional[Tuple[Any, ...]] = None
+        self._status_cache: Optional[Dict[str, Any]] = None
+        
+        # ((revision, group, module), result) of the last validate_current_data
+        self._validation_cache: Optional[Tuple[Tuple[Any, ...], Tuple[bool, List[str]]]] = None
+        
+        # (alpha tree signature, textures) from the last alpha texture scan
+        self._alpha_cache: Optional[Tuple[Tuple[Tuple[str, int], ...], Dict[str, str]]] = None
+    
+    def _mark_unsaved(self, category_bit: int) -> None:
+        """Flag a category as having unsaved changes"""
+        self._unsaved_changes |= category_bit
+        self._data_revision += 1
+    
+    def _mark_saved(self, category_bit: int) -> None:
+        """Clear a category's unsaved flag after it was loaded or saved"""
+        self._unsaved_changes &= ~category_bit
+        self._data_revision += 1
+    
+    @property
+    def group_manager(self) -> "GroupManager":
+        """Group manager, created on first use"""
+        if self._group_manager is None:
+            from .group_manager import GroupManager
+            self._group_manager = GroupManager()
+        return self._group_manager
     
     def refresh_all_data(self) -> Tuple[bool, str]:
         """
@@ -47,35 +105,50 @@ class DataManager:
             self._cached_groups = None
             self._cached_modules = None
             self._cache_valid = False
+            self._status_cache = None
+            self._alpha_cache = None
             
             # Reset change tracking
-            self._change_tracking = {key: False for key in self._change_tracking}
+            self._unsaved_changes = 0
+            self._data_revision += 1
+            self._validation_cache = None
+            
+            # Re-read USD files from disk on next access
+            from ..utils import clear_stage_cache
+            clear_stage_cache()
             
-            # Refresh directory manager if needed
-            if config.usd_directory:
-                from ..utils import get_directory_manager
-                self.group_manager.directory_manager = None
-                self.group_manager.directory_manager = get_directory_manager(config.usd_directory)
+            # Rebuild the directory manager only if the USD directory moved;
+            # it holds no cached listings, so an existing one stays valid.
+            # A group manager that hasn't been created yet builds its own.
+            if self._group_manager is not None and config.usd_directory:
+                directory_manager = self._group_manager.directory_manager
+                if directory_manager is None or directory_manager.base_directory != config.usd_directory:
+                    from ..utils import get_directory_manager
+                    self._group_manager.directory_manager = get_directory_manager(config.usd_directory)
             
             return True, "Data refreshed successfully"
             
         except Exception as e:
             return False, f"Error refreshing data: {str(e)}"
     
-    def get_groups(self, force_refresh: bool = False) -> List[str]:
+    def get_groups(self, force_refresh: bool = False) -> Tuple[str, ...]:
         """
-        Get list of available groups with caching
+        Get available groups with caching
         
         Args:
             force_refresh: Force refresh from disk
             
         Returns:
-            List of group names
+            Tuple of group names (the cached value itself, so it is read-only)
         """
-        if force_refresh or self._cached_groups is None:
-            self._cached_groups = self.group_manager.get_available_groups()
+        if not config.usd_directory:
+            return ()
         
-        return self._cached_groups or []
+        # The group manager only rescans when the Group directory changed on disk
+        if self._cached_groups is None or force_refresh:
+            self._cached_groups = tuple(self.group_manager.get_available_groups())
+        
+        return self._cached_groups
     
     def load_group(self, group_name: str) -> Tuple[bool, str]:
         """
@@ -91,7 +164,7 @@ class DataManager:
         
         if success:
             # Reset change tracking for group
-            self._change_tracking['group'] = False
+            self._mark_saved(self._GROUP_CHANGED)
             
             # Set current group context for module manager
             self.module_manager.set_current_group(group_name)
@@ -118,7 +191,7 @@ class DataManager:
             # Invalidate group cache
             self._cached_groups = None
             # Mark as having changes
-            self._change_tracking['group'] = True
+            self._mark_unsaved(self._GROUP_CHANGED)
         
         return success, message
     
@@ -133,7 +206,7 @@ class DataManager:
         
         if success:
             # Clear change tracking for group
-            self._change_tracking['group'] = False
+            self._mark_saved(self._GROUP_CHANGED)
         
         return success, message
     
@@ -148,8 +221,22 @@ class DataManager:
         Returns:
             List of module names
         """
-        if force_refresh or self._cached_modules is None:
-            self._cached_modules = self.module_manager.get_available_modules()
+        current_group = self.module_manager.current_group
+        if not config.usd_directory or not current_group:
+            return []
+        
+        if self._cached_modules is None or force_refresh:
+            # Module availability depends on the group's whitelist and on which
+            # files exist in the module type directories; a forced refresh
+            # only rescans when one of them changed on disk
+            module_dir = config.usd_directory / "module"
+            signature = _mtime_signature(
+                [config.usd_directory / "Group" / f"{current_group}.usd"]
+                + [module_dir / module_type for module_type in ("scalp", "crown", "tail", "bang")]
+            )
+            if self._cached_modules is None or signature != self._modules_signature:
+                self._cached_modules = self.module_manager.get_available_modules()
+                self._modules_signature = signature
         
         return self._cached_modules or []
     
@@ -167,7 +254,7 @@ class DataManager:
         
         if success:
             # Reset change tracking for modules
-            self._change_tracking['modules'] = False
+            self._mark_saved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -188,7 +275,7 @@ class DataManager:
             # Invalidate module cache
             self._cached_modules = None
             # Mark as having changes
-            self._change_tracking['modules'] = True
+            self._mark_unsaved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -203,7 +290,7 @@ class DataManager:
         
         if success:
             # Clear change tracking for modules
-            self._change_tracking['modules'] = False
+            self._mark_saved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -248,7 +335,7 @@ class DataManager:
         success, message = self.module_manager.import_geometry_from_scene(maya_object_name)
         
         if success:
-            self._change_tracking['modules'] = True
+            self._mark_unsaved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -278,7 +365,7 @@ class DataManager:
         success, message = self.module_manager.add_blendshape_from_scene(maya_object_name, blendshape_name)
         
         if success:
-            self._change_tracking['modules'] = True
+            self._mark_unsaved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -295,7 +382,7 @@ class DataManager:
         success, message = self.module_manager.remove_blendshape(blendshape_name)
         
         if success:
-            self._change_tracking['modules'] = True
+            self._mark_unsaved(self._MODULES_CHANGED)
         
         return success, message
     
@@ -327,21 +414,37 @@ class DataManager:
         success, message = self.module_manager.set_blendshape_exclusion(blendshape_name, excluded_blendshape, excluded)
         
         if success:
-            self._change_tracking['modules'] = True
+            self._mark_unsaved(self._MODULES_CHANGED)
         
         return success, message
     
     def get_current_group(self) -> Optional[str]:
         """Get name of currently loaded group"""
-        return self.group_manager.current_group
+        if self._group_manager is None:
+            return None
+        return self._group_manager.current_group
     
-    def get_group_alpha_whitelist(self) -> Dict[str, bool]:
-        """Get alpha whitelist for current group"""
-        return self.group_manager.alpha_whitelist.copy()
+    def get_group_alpha_whitelist(self) -> Mapping[str, bool]:
+        """Get a read-only view of the alpha whitelist for current group"""
+        return MappingProxyType(self.group_manager.alpha_whitelist)
     
     def get_available_alpha_textures(self) -> Dict[str, str]:
-        """Get all available alpha textures"""
-        return self.group_manager.get_available_alpha_textures()
+        """Get all available alpha textures, rescanning only when the alpha folders changed"""
+        if not config.usd_directory:
+            return {}
+        
+        # The scan records the mtime of every directory it listed; the cached
+        # result is fresh while none of them changed, which only takes a stat each
+        if self._alpha_cache is not None:
+            dir_mtimes = self._alpha_cache[0]
+            if _mtime_signature([path for path, _ in dir_mtimes]) == dir_mtimes:
+                return dict(self._alpha_cache[1])
+        
+        dir_mtimes = []
+        textures = self.group_manager.get_available_alpha_textures(dir_mtimes)
+        self._alpha_cache = (tuple(dir_mtimes), textures)
+        
+        return dict(textures)
     
     def update_alpha_whitelist(self, texture_path: str, enabled: bool) -> None:
         """
@@ -352,7 +455,7 @@ class DataManager:
             enabled: Whether texture should be enabled
         """
         self.group_manager.update_alpha_whitelist(texture_path, enabled)
-        self._change_tracking['group'] = True
+        self._mark_unsaved(self._GROUP_CHANGED)
     
     def add_alpha_texture_path(self, texture_path: str, enabled: bool = True) -> Tuple[bool, str]:
         """
@@ -368,7 +471,8 @@ class DataManager:
         success, message = self.group_manager.add_alpha_texture_path(texture_path, enabled)
         
         if success:
-            self._change_tracking['group'] = True
+            self._mark_unsaved(self._GROUP_CHANGED)
+            self._alpha_cache = None
         
         return success, message
     
@@ -385,7 +489,8 @@ class DataManager:
         success, message = self.group_manager.remove_alpha_texture_path(texture_path)
         
         if success:
-            self._change_tracking['group'] = True
+            self._mark_unsaved(self._GROUP_CHANGED)
+            self._alpha_cache = None
         
         return success, message
     
@@ -401,9 +506,9 @@ class DataManager:
             True if there are unsaved changes
         """
         if category:
-            return self._change_tracking.get(category, False)
+            return bool(self._unsaved_changes & self._CATEGORY_BITS.get(category, 0))
         
-        return any(self._change_tracking.values())
+        return bool(self._unsaved_changes)
     
     def get_unsaved_categories(self) -> List[str]:
         """
@@ -412,7 +517,33 @@ class DataManager:
         Returns:
             List of category names with changes
         """
-        return [category for category, has_changes in self._change_tracking.items() if has_changes]
+        return [category for category, bit in self._CATEGORY_BITS.items() if self._unsaved_changes & bit]
+    
+    def _get_validation_key(self) -> Tuple[Any, ...]:
+        """
+        Key for the validation cache
+        
+        Validation also checks the disk, so besides the data revision the key
+        holds the mtimes of the paths it looks at: the group and module files,
+        each whitelisted alpha texture, and the module folder whose mtime
+        changes when one of the group's module files is added or removed.
+        """
+        current_group = self.get_current_group()
+        current_module = self.module_manager.current_module
+        if not config.usd_directory:
+            return (self._data_revision, current_group, current_module)
+        
+        paths = []
+        if current_group:
+            module_dir = config.usd_directory / "module"
+            paths.append(config.usd_directory / "Group" / f"{current_group}.usd")
+            paths.append(module_dir)
+            paths.extend(module_dir / texture_path for texture_path in self.group_manager.alpha_whitelist)
+        module_info = self.module_manager.modules.get(current_module) if current_module else None
+        if module_info:
+            paths.append(module_info.file_path)
+        
+        return (self._data_revision, current_group, current_module, _mtime_signature(paths))
     
     def validate_current_data(self) -> Tuple[bool, List[str]]:
         """
@@ -421,10 +552,17 @@ class DataManager:
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
+        # Nothing loaded, edited or saved since the last run, and nothing
+        # changed on disk, gives the same result
+        cache_key = self._get_validation_key()
+        if self._validation_cache is not None and self._validation_cache[0] == cache_key:
+            is_valid, issues = self._validation_cache[1]
+            return is_valid, list(issues)
+        
         all_issues = []
         
         # Validate current group
-        if self.group_manager.current_group:
+        if self.get_current_group():
             is_valid, group_issues = self.group_manager.validate_current_group()
             all_issues.extend(group_issues)
         
@@ -435,7 +573,9 @@ class DataManager:
         
         # TODO: Add style validation when style manager is implemented
         
-        return len(all_issues) == 0, all_issues
+        result = (len(all_issues) == 0, all_issues)
+        self._validation_cache = (cache_key, (result[0], list(all_issues)))
+        return result
     
     def get_status_summary(self) -> Dict[str, Any]:
         """
@@ -444,12 +584,31 @@ class DataManager:
         Returns:
             Dictionary with status information
         """
-        return {
-            'current_group': self.get_current_group(),
-            'current_module': self.get_current_module(),
-            'available_groups': len(self.get_groups()),
-            'available_modules': len(self.get_modules()),
-            'unsaved_changes': self.get_unsaved_categories(),
-            'usd_directory': str(config.usd_directory) if config.usd_directory else None,
-            'has_changes': self.has_unsaved_changes()
-        }
\ No newline at end of file
+        if self._status_cache is None or self._status_cache_key != self._get_status_key():
+            self._status_cache = {
+                'current_group': self.get_current_group(),
+                'current_module': self.get_current_module(),
+                'available_groups': len(self.get_groups()),
+                'available_modules': len(self.get_modules()),
+                'unsaved_changes': self.get_unsaved_categories(),
+                'usd_directory': str(config.usd_directory) if config.usd_directory else None,
+                'has_changes': self.has_unsaved_changes()
+            }
+            # Key on the state after building, since the listings may have just been cached
+            self._status_cache_key = self._get_status_key()
+        
+        # Copy the nested list too, so callers can't change the cached summary
+        status = dict(self._status_cache)
+        status['unsaved_changes'] = list(status['unsaved_changes'])
+        return status
+    
+    def _get_status_key(self) -> Tuple[Any, ...]:
+        """Everything get_status_summary depends on, read without touching disk"""
+        return (
+            self._unsaved_changes,
+            None if self._cached_groups is None else len(self._cached_groups),
+            None if self._cached_modules is None else len(self._cached_modules),
+            self.get_current_group(),
+            self.get_current_module(),
+            config.usd_directory
+        )
\ No newline at end of file
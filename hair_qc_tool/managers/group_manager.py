@@ -6,25 +6,67 @@ Manages group-level data including alpha whitelists and cross-module rules.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Tuple, Any
 
 from ..config import config
-from ..utils import (
-    USDGroupUtils, USDDirectoryManager, USDValidationUtils,
-    create_group_file, BlendshapeRulesManager, get_directory_manager
-)
+
+# The USD utilities are imported by the methods that use them (after their
+# guard clauses) so that importing this module doesn't load the USD bindings
+if TYPE_CHECKING:
+    from ..utils import USDDirectoryManager
+
+
+def _dir_mtime(path: str) -> int:
+    """st_mtime_ns of path, or 0 if it is missing"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _iter_pngs(root: str, prefix: str,
+               dir_mtimes: Optional[List[Tuple[str, int]]] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively yield (prefix-relative path, file name) for PNG files under root
+    
+    Uses the d_type information from os.scandir, so no per-entry stat calls are
+    made. The extension match ignores case, as glob does on Windows. A missing
+    root yields nothing. If dir_mtimes is given, (directory, st_mtime_ns) is
+    appended for every directory before it is listed.
+    """
+    if dir_mtimes is not None:
+        dir_mtimes.append((root, _dir_mtime(root)))
+    
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        rel_path = os.path.join(prefix, entry.name)
+        if entry.is_dir():
+            yield from _iter_pngs(entry.path, rel_path, dir_mtimes)
+        elif entry.name.lower().endswith(".png"):
+            yield rel_path, entry.name
 
 
 class GroupManager:
     """Manages Group USD files and related data"""
     
     def __init__(self):
+        from ..utils import BlendshapeRulesManager, get_directory_manager
+        
         self.current_group: Optional[str] = None
         self.group_data: Dict[str, Any] = {}
         self.alpha_whitelist: Dict[str, bool] = {}
         self.rules_manager: BlendshapeRulesManager = BlendshapeRulesManager()
-        self.directory_manager: Optional[USDDirectoryManager] = None
+        self.directory_manager: Optional["USDDirectoryManager"] = None
+        
+        # ((group dir, st_mtime_ns), sorted group names) from the last listing
+        self._groups_cache: Optional[Tuple[Tuple[str, int], List[str]]] = None
         
         # Initialize directory manager if USD directory is set
         if config.usd_directory:
@@ -35,15 +77,24 @@ class GroupManager:
         if not config.usd_directory:
             return []
         
-        group_dir = config.usd_directory / "Group"
-        if not group_dir.exists():
+        group_dir = str(config.usd_directory / "Group")
+        try:
+            cache_key = (group_dir, os.stat(group_dir).st_mtime_ns)
+        except OSError:
             return []
         
-        groups = []
-        for usd_file in group_dir.glob("*.usd"):
-            groups.append(usd_file.stem)
-        
-        return sorted(groups)
+        # Adding or removing a group file bumps the directory's mtime
+        if self._groups_cache is None or self._groups_cache[0] != cache_key:
+            groups = []
+            with os.scandir(group_dir) as it:
+                for entry in it:
+                    # Exact match: loaders rebuild the path as <name>.usd
+                    if entry.name.endswith(".usd") and entry.is_file():
+                        groups.append(entry.name[:-len(".usd")])
+            groups.sort()
+            self._groups_cache = (cache_key, groups)
+        
+        return list(self._groups_cache[1])
     
     def load_group(self, group_name: str) -> Tuple[bool, str]:
         """
@@ -62,6 +113,8 @@ class GroupManager:
         if not group_file.exists():
             return False, f"Group file not found: {group_file}"
         
+        from ..utils import BlendshapeRulesManager, USDGroupUtils, USDValidationUtils
+        
         try:
             # Validate group file
             is_valid, validation_msg = USDValidationUtils.validate_group_file(group_file)
@@ -125,6 +178,8 @@ class GroupManager:
         if not config.usd_directory:
             return False, "No USD directory set"
         
+        from ..utils import USDGroupUtils, create_group_file, get_directory_manager
+        
         if not self.directory_manager:
             self.directory_manager = get_directory_manager(config.usd_directory)
         
@@ -150,6 +205,8 @@ class GroupManager:
             if not success:
                 return False, "Failed to create group USD file"
             
+            self._groups_cache = None
+            
             # Initialize with default alpha whitelist (all alphas enabled)
             default_alpha_whitelist = self._get_default_alpha_whitelist()
             
@@ -175,6 +232,8 @@ class GroupManager:
         if not config.usd_directory:
             return False, "No USD directory set"
         
+        from ..utils import USDGroupUtils
+        
         group_file = config.usd_directory / "Group" / f"{self.current_group}.usd"
         
         try:
@@ -205,10 +264,16 @@ class GroupManager:
         except Exception as e:
             return False, f"Error saving group: {str(e)}"
     
-    def get_available_alpha_textures(self) -> Dict[str, str]:
+    def get_available_alpha_textures(self, dir_mtimes: Optional[List[Tuple[str, int]]] = None) -> Dict[str, str]:
         """
         Get all available alpha textures from the module directory
         
+        Args:
+            dir_mtimes: If given, receives (directory, st_mtime_ns) for every
+                directory scanned. Adding or removing a texture or folder
+                changes one of these mtimes, so callers can check freshness
+                with stat calls alone.
+        
         Returns:
             Dictionary mapping texture paths to their display names
         """
@@ -216,22 +281,27 @@ class GroupManager:
             return {}
         
         textures = {}
-        module_dir = config.usd_directory / "module"
+        module_dir = str(config.usd_directory / "module")
+        if dir_mtimes is not None:
+            dir_mtimes.append((module_dir, _dir_mtime(module_dir)))
         
         # Scan for alpha textures in module subdirectories
-        for module_type_dir in module_dir.iterdir():
-            if not module_type_dir.is_dir():
-                continue
-            
-            alpha_dir = module_type_dir / "alpha"
-            if not alpha_dir.exists():
-                continue
+        try:
+            with os.scandir(module_dir) as it:
+                module_type_dirs = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            return {}
+        
+        for module_type_dir in module_type_dirs:
+            alpha_dir = os.path.join(module_type_dir.path, "alpha")
+            if dir_mtimes is not None:
+                # Creating or removing the alpha folder changes this mtime
+                dir_mtimes.append((module_type_dir.path, _dir_mtime(module_type_dir.path)))
             
-            # Recursively find PNG files in alpha directory
-            for png_file in alpha_dir.rglob("*.png"):
-                # Create relative path from module directory
-                rel_path = png_file.relative_to(module_dir)
-                textures[str(rel_path)] = f"{module_type_dir.name}/{rel_path.name}"
+            # Keys are relative to the module directory
+            prefix = os.path.join(module_type_dir.name, "alpha")
+            for rel_path, name in _iter_pngs(alpha_dir, prefix, dir_mtimes):
+                textures[rel_path] = f"{module_type_dir.name}/{name}"
         
         return textures
     
@@ -296,6 +366,8 @@ class GroupManager:
         if not self.current_group or not config.usd_directory:
             return []
         
+        from ..utils import USDGroupUtils
+        
         try:
             group_file = config.usd_directory / "Group" / f"{self.current_group}.usd"
             group_utils = USDGroupUtils(group_file)
@@ -339,6 +411,8 @@ class GroupManager:
             issues.append(f"Group file not found: {group_file}")
             return False, issues
         
+        from ..utils import USDValidationUtils
+        
         is_valid, validation_msg = USDValidationUtils.validate_group_file(group_file)
         if not is_valid:
             issues.append(f"Invalid group file: {validation_msg}")
@@ -8,7 +8,8 @@ Maya integration, and data management.
 # Import main utility classes for easy access
 from .usd_utils import (
     USDGroupUtils, USDModuleUtils, USDStyleUtils, USDValidationUtils,
-    create_group_file, create_module_file, create_style_file
+    create_group_file, create_module_file, create_style_file,
+    clear_stage_cache
 )
 
 from .rules_utils import (
@@ -37,6 +38,7 @@ __all__ = [
     # USD utilities
     'USDGroupUtils', 'USDModuleUtils', 'USDStyleUtils', 'USDValidationUtils',
     'create_group_file', 'create_module_file', 'create_style_file',
+    'clear_stage_cache',
     
     # Rules and constraints
     'BlendshapeRule', 'BlendshapeRulesManager', 'CombinationGenerator',
@@ -6,6 +6,7 @@ for Hair QC Tool specific data types like BlendshapeRules and CrossModuleExclusi
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 import traceback
@@ -18,6 +19,54 @@ except ImportError:
     USD_AVAILABLE = False
 
 
+# Read-only stages keyed by file path -> (st_mtime_ns, stage), oldest first
+_stage_cache: Dict[str, Tuple[int, Any]] = {}
+_STAGE_CACHE_SIZE = 16
+
+
+def _release_stale_stage(key: str, mtime: int):
+    """
+    Drop the cached handle for key if the file changed on disk since it was
+    opened (mtime is the file's current st_mtime_ns) or its layer holds
+    unsaved edits
+    
+    A cached stage keeps its root layer alive in the layer registry, and
+    Usd.Stage.Open reuses a live layer as is. Without this, later opens of
+    the file would see the old content or edits a writer abandoned.
+    """
+    cached = _stage_cache.get(key)
+    if cached and (cached[0] != mtime or cached[1].GetRootLayer().dirty):
+        del _stage_cache[key]
+
+
+def open_cached_stage(file_path: Union[str, Path]):
+    """
+    Open a USD stage for reading, reusing the previous handle while the file
+    is unchanged on disk. Writers must open their own stage (see open_stage).
+    """
+    key = str(file_path)
+    mtime = os.stat(key).st_mtime_ns
+    
+    # Drop a stale handle first so its layer is released before reopening
+    _release_stale_stage(key, mtime)
+    cached = _stage_cache.pop(key, None)
+    if cached:
+        _stage_cache[key] = cached
+        return cached[1]
+    
+    stage = Usd.Stage.Open(key)
+    if stage:
+        _stage_cache[key] = (mtime, stage)
+        while len(_stage_cache) > _STAGE_CACHE_SIZE:
+            del _stage_cache[next(iter(_stage_cache))]
+    return stage
+
+
+def clear_stage_cache():
+    """Forget all cached stage handles so the next open re-reads from disk"""
+    _stage_cache.clear()
+
+
 class USDUtilsBase:
     """Base class for USD utilities with common functionality"""
     
@@ -33,6 +82,11 @@ class USDUtilsBase:
         
         try:
             if self.file_path.exists():
+                # Edits go to a stage of our own rather than the shared
+                # read-only cache, and never start from stale content or
+                # abandoned edits
+                key = str(self.file_path)
+                _release_stale_stage(key, os.stat(key).st_mtime_ns)
                 self.stage = Usd.Stage.Open(str(self.file_path))
             elif create_if_missing:
                 self.stage = Usd.Stage.CreateNew(str(self.file_path))
@@ -516,7 +570,7 @@ class USDValidationUtils:
             if not file_path.exists():
                 return False, f"File does not exist: {file_path}"
             
-            stage = Usd.Stage.Open(str(file_path))
+            stage = open_cached_stage(file_path)
             if not stage:
                 return False, "Could not open USD stage"
             
@@ -546,7 +600,7 @@ class USDValidationUtils:
             if not file_path.exists():
                 return False, f"File does not exist: {file_path}"
             
-            stage = Usd.Stage.Open(str(file_path))
+            stage = open_cached_stage(file_path)
             if not stage:
                 return False, "Could not open USD stage"
             
@@ -576,7 +630,7 @@ class USDValidationUtils:
             if not file_path.exists():
                 return False, f"File does not exist: {file_path}"
             
-            stage = Usd.Stage.Open(str(file_path))
+            stage = open_cached_stage(file_path)
             if not stage:
                 return False, "Could not open USD stage"
             
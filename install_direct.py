@@ -12,6 +12,8 @@ import sys
 import os
 from pathlib import Path
 
+_HR = "=" * 60
+
 # Try to auto-detect project path from script location
 def get_project_path():
     """Auto-detect project path from various sources"""
@@ -54,9 +56,9 @@ def get_project_path():
 def install_hair_qc_tool():
     """Install Hair QC Tool with automatic path detection"""
     
-    print("="*60)
+    print(_HR)
     print("Hair QC Tool Installation")
-    print("="*60)
+    print(_HR)
     
     # Auto-detect project path
     project_path = get_project_path()
@@ -84,31 +86,14 @@ def install_hair_qc_tool():
         # Reload modules if they were previously imported to get latest changes
         print("[INFO] Importing Hair QC Tool modules...")
         
-        # Check if modules are already imported and reload them
+        # Drop previously imported modules so the imports below load fresh code.
+        # Purging by package prefix covers every submodule, and the import
+        # system then executes each one exactly once in dependency order.
         if 'hair_qc_tool' in sys.modules:
-            print("[INFO] Reloading existing modules to get latest changes...")
-            import importlib
-            
-            # Reload in dependency order (from leaf modules to root)
-            modules_to_reload = [
-                'hair_qc_tool.config',
-                'hair_qc_tool.utils.usd_utils',
-                'hair_qc_tool.utils.rules_utils',
-                'hair_qc_tool.utils.file_utils',
-                'hair_qc_tool.utils.maya_utils',
-                'hair_qc_tool.utils',
-                'hair_qc_tool.managers.group_manager',
-                'hair_qc_tool.managers.data_manager',
-                'hair_qc_tool.managers',
-                'hair_qc_tool.ui.main_window',
-                'hair_qc_tool.ui',
-                'hair_qc_tool.main',
-                'hair_qc_tool'
-            ]
-            
-            for module_name in modules_to_reload:
-                if module_name in sys.modules:
-                    importlib.reload(sys.modules[module_name])
+            print("[INFO] Unloading existing modules to get latest changes...")
+            stale_modules = [name for name in sys.modules if name.partition('.')[0] == 'hair_qc_tool']
+            for module_name in stale_modules:
+                del sys.modules[module_name]
         
         from hair_qc_tool.main import install_maya_menu, create_shelf_button
         from hair_qc_tool import launch_hair_qc_tool
@@ -122,14 +107,14 @@ def install_hair_qc_tool():
         print("[INFO] Creating shelf button...")
         create_shelf_button()
         
-        print("="*60)
+        print(_HR)
         print("Hair QC Tool installed successfully!")
-        print("="*60)
+        print(_HR)
         print("Available options:")
         print("  - Menu: Hair QC > Open Hair QC Tool")
         print("  - Shelf: Hair QC button added to current shelf")
         print("  - Command: launch_hair_qc_tool()")
-        print("="*60)
+        print(_HR)
         
         # Launch the tool with new directory initialization features
         import maya.cmds as cmds
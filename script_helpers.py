@@ -0,0 +1,56 @@
+"""
+Shared helpers for the standalone test and debug scripts
+"""
+
+import functools
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+# Full tracebacks are noisy for the expected failures (missing USD/Maya);
+# set HAIRQC_DEBUG_TB=1 to print them
+SHOW_TRACEBACKS = bool(os.environ.get("HAIRQC_DEBUG_TB"))
+
+def buffered_output(func):
+    """Collect everything func prints and write it to stdout in one go"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+# Group whitelists keyed by file path -> (st_mtime_ns, whitelist)
+_WHITELIST_CACHE = {}
+
+def cached_module_whitelist(group_file):
+    """Read a group's module whitelist, reusing the last parse if the file is unchanged"""
+    from hair_qc_tool.utils import USDGroupUtils
+    
+    mtime = group_file.stat().st_mtime_ns
+    cached = _WHITELIST_CACHE.get(group_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    whitelist = USDGroupUtils(group_file).get_module_whitelist()
+    _WHITELIST_CACHE[group_file] = (mtime, whitelist)
+    return whitelist
+
+def scan_module_dirs(module_dir):
+    """List module names per type subdirectory (None if the subdirectory is missing)"""
+    with os.scandir(module_dir) as it:
+        subdirs = {entry.name: entry.path for entry in it if entry.is_dir(follow_symlinks=False)}
+    
+    modules = {}
+    for subdir in ["scalp", "crown", "tail", "bang"]:
+        if subdir not in subdirs:
+            modules[subdir] = None
+            continue
+        with os.scandir(subdirs[subdir]) as it:
+            modules[subdir] = [entry.name[:-4] for entry in it if entry.name.endswith(".usd")]
+    return modules
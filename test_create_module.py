@@ -3,24 +3,26 @@ Test creating a module and adding it to a group whitelist
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add hair_qc_tool to path
-project_path = Path(__file__).parent
-if str(project_path) not in sys.path:
-    sys.path.insert(0, str(project_path))
+project_path = str(Path(__file__).parent)
+if project_path not in sys.path:
+    sys.path.insert(0, project_path)
+
+from hair_qc_tool.config import config
+from hair_qc_tool.utils import USDGroupUtils, clear_stage_cache, create_module_file
+
+_HR = "=" * 60
 
 def test_create_module():
     """Test creating a module without Maya dependencies"""
-    print("="*60)
+    print(_HR)
     print("TEST: Create Module and Add to Group")
-    print("="*60)
+    print(_HR)
     
     try:
-        from hair_qc_tool.config import config
-        from hair_qc_tool.utils import USDGroupUtils, create_module_file
-        import time
-        
         # Check USD directory
         if not config.usd_directory:
             print("❌ No USD directory configured")
@@ -30,13 +32,14 @@ def test_create_module():
         
         # Get first available group
         group_dir = config.usd_directory / "Group"
-        group_files = list(group_dir.glob("*.usd"))
+        group_files = sorted(path for path in group_dir.iterdir() if path.suffix == ".usd")
         
         if not group_files:
             print("❌ No groups available")
             return
         
-        test_group = group_files[0].stem
+        group_file = group_files[0]
+        test_group = group_file.stem
         print(f"✅ Using test group: {test_group}")
         
         # Create a test module
@@ -63,7 +66,6 @@ def test_create_module():
         # Add module to group whitelist
         print(f"✅ Adding module to group '{test_group}' whitelist...")
         
-        group_file = group_dir / f"{test_group}.usd"
         group_utils = USDGroupUtils(group_file)
         
         # Get existing whitelist
@@ -80,8 +82,12 @@ def test_create_module():
         
         print(f"✅ Module added to group whitelist")
         
-        # Verify by reading back
+        # Verify by reading back from disk; release the written stage (and any
+        # cached handle) first so the file is re-read rather than the layer
+        # still held in memory
         print(f"✅ Verifying by reading back...")
+        group_utils.close_stage()
+        clear_stage_cache()
         group_utils_verify = USDGroupUtils(group_file)
         verify_whitelist = group_utils_verify.get_module_whitelist()
         print(f"✅ Verified whitelist: {verify_whitelist}")
@@ -5,6 +5,8 @@ Run this to test the Group management functionality.
 This can be run in Maya to test the actual UI integration.
 """
 
+import importlib
+import os
 import sys
 from pathlib import Path
 
@@ -13,13 +15,39 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+from script_helpers import buffered_output
+
+# Import the managers once; each test reports the failure if this didn't work
+try:
+    from hair_qc_tool.config import config
+    from hair_qc_tool.managers import DataManager, GroupManager
+except ImportError as e:
+    _IMPORT_ERROR = e
+else:
+    _IMPORT_ERROR = None
+
+# The UI needs Maya/PySide2 and is expected to be missing outside Maya. This is
+# only an availability probe: the window can't be created without Maya's Qt
+try:
+    importlib.import_module("hair_qc_tool.ui.main_window")
+except ImportError as e:
+    _UI_IMPORT_ERROR = e
+else:
+    _UI_IMPORT_ERROR = None
+
+_HR = "=" * 60
+
+# Stop at the first failing test (set HAIR_QC_TEST_FAILFAST=1)
+FAILFAST = bool(os.environ.get("HAIR_QC_TEST_FAILFAST"))
+
+@buffered_output
 def test_group_manager():
     """Test the GroupManager class directly"""
     print("Testing GroupManager...")
     
     try:
-        from hair_qc_tool.managers import GroupManager
-        from hair_qc_tool.config import config
+        if _IMPORT_ERROR is not None:
+            raise ImportError(str(_IMPORT_ERROR)) from _IMPORT_ERROR
         
         # Check if we have a USD directory configured
         if not config.usd_directory:
@@ -63,15 +91,17 @@ def test_group_manager():
     except Exception as e:
         print(f"❌ GroupManager test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
+@buffered_output
 def test_data_manager():
     """Test the DataManager class"""
     print("\nTesting DataManager...")
     
     try:
-        from hair_qc_tool.managers import DataManager
+        if _IMPORT_ERROR is not None:
+            raise ImportError(str(_IMPORT_ERROR)) from _IMPORT_ERROR
         
         # Create data manager
         data_manager = DataManager()
@@ -109,16 +139,18 @@ def test_data_manager():
     except Exception as e:
         print(f"❌ DataManager test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
+@buffered_output
 def test_ui_integration():
     """Test if the UI can be created with new managers"""
     print("\nTesting UI Integration...")
     
     try:
         # This test requires Maya/PySide2
-        from hair_qc_tool.ui.main_window import HairQCMainWindow
+        if _UI_IMPORT_ERROR is not None:
+            raise ImportError(str(_UI_IMPORT_ERROR)) from _UI_IMPORT_ERROR
         print("✅ UI classes can be imported")
         
         # Note: We can't actually create the window here without Maya's Qt environment
@@ -131,28 +163,31 @@ def test_ui_integration():
     except Exception as e:
         print(f"❌ UI integration test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 def run_all_tests():
     """Run all Group Management tests"""
-    print("="*60)
+    print(_HR)
     print("Hair QC Tool - Group Management Test")
-    print("="*60)
+    print(_HR)
     
     results = []
     
     # Test individual managers
-    results.append(test_group_manager())
-    results.append(test_data_manager())
-    results.append(test_ui_integration())
+    tests = [test_group_manager, test_data_manager, test_ui_integration]
+    for test in tests:
+        result = test()
+        results.append(result)
+        if not result and FAILFAST:
+            break
     
-    print("\n" + "="*60)
+    print(f"\n{_HR}")
     print("Test Results Summary")
-    print("="*60)
+    print(_HR)
     
-    passed = sum(results)
-    total = len(results)
+    passed = results.count(True)
+    total = len(tests)
     
     print(f"Tests passed: {passed}/{total}")
     
@@ -10,6 +10,8 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+_HR = "=" * 60
+
 def test_module_directory_structure():
     """Test that modules are created in correct subdirectories"""
     print("Testing Module Directory Structure Fix...")
@@ -103,13 +105,13 @@ def test_module_directory_structure():
         return False
 
 if __name__ == "__main__":
-    print("="*60)
+    print(_HR)
     print("Module Directory Structure Fix Test")
-    print("="*60)
+    print(_HR)
     
     success = test_module_directory_structure()
     
-    print("\n" + "="*60)
+    print(f"\n{_HR}")
     if success:
         print("🎉 Module directory structure fix test PASSED!")
         print("\nThe fix should resolve:")
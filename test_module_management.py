@@ -5,6 +5,9 @@ Run this to test the Module management functionality.
 This can be run in Maya to test the actual UI integration.
 """
 
+import functools
+import os
+import secrets
 import sys
 from pathlib import Path
 
@@ -13,13 +16,38 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+from script_helpers import buffered_output
+
+# Import the managers once; each test reports the failure if this didn't work
+try:
+    from hair_qc_tool.config import config
+    from hair_qc_tool.managers import DataManager, ModuleManager
+except ImportError as e:
+    _IMPORT_ERROR = e
+else:
+    _IMPORT_ERROR = None
+
+# The UI needs Maya/PySide2 and is expected to be missing outside Maya
+try:
+    from hair_qc_tool.ui.main_window import HairQCMainWindow
+except ImportError as e:
+    _UI_IMPORT_ERROR = e
+else:
+    _UI_IMPORT_ERROR = None
+
+_HR = "=" * 60
+
+# Stop at the first failing test (set HAIR_QC_TEST_FAILFAST=1)
+FAILFAST = bool(os.environ.get("HAIR_QC_TEST_FAILFAST"))
+
+@buffered_output
 def test_module_manager():
     """Test the ModuleManager class directly"""
     print("Testing ModuleManager...")
     
     try:
-        from hair_qc_tool.managers import ModuleManager
-        from hair_qc_tool.config import config
+        if _IMPORT_ERROR is not None:
+            raise ImportError(str(_IMPORT_ERROR)) from _IMPORT_ERROR
         
         # Check if we have a USD directory configured
         if not config.usd_directory:
@@ -67,22 +95,29 @@ def test_module_manager():
     except Exception as e:
         print(f"❌ ModuleManager test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
-def test_data_manager_modules():
-    """Test the DataManager module functionality"""
+@buffered_output
+def test_data_manager_modules(data_manager=None):
+    """Test the DataManager module functionality
+    
+    Args:
+        data_manager: Already refreshed DataManager shared by run_all_tests
+    """
     print("\nTesting DataManager Module Functions...")
     
     try:
-        from hair_qc_tool.managers import DataManager
-        
-        # Create data manager
-        data_manager = DataManager()
+        if _IMPORT_ERROR is not None:
+            raise ImportError(str(_IMPORT_ERROR)) from _IMPORT_ERROR
         
-        # Test refresh
-        success, message = data_manager.refresh_all_data()
-        print(f"✅ Refresh result: {success} - {message}")
+        if data_manager is None:
+            # Create data manager
+            data_manager = DataManager()
+            
+            # Test refresh
+            success, message = data_manager.refresh_all_data()
+            print(f"✅ Refresh result: {success} - {message}")
         
         # Load a group first (required for modules)
         groups = data_manager.get_groups()
@@ -120,31 +155,31 @@ def test_data_manager_modules():
     except Exception as e:
         print(f"❌ DataManager module test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
+@buffered_output
 def test_ui_integration():
     """Test if the UI can handle module functionality"""
     print("\nTesting Module UI Integration...")
     
     try:
         # This test requires Maya/PySide2
-        from hair_qc_tool.ui.main_window import HairQCMainWindow
+        if _UI_IMPORT_ERROR is not None:
+            raise ImportError(str(_UI_IMPORT_ERROR)) from _UI_IMPORT_ERROR
         print("✅ UI classes can be imported")
         
         # Test if module methods exist
-        required_methods = [
+        required_methods = {
             'load_modules', 'load_module_edit_data', 'load_module_blendshapes',
             'add_module', 'add_blendshape', 'replace_base_mesh', 'save_module',
             'on_module_selected', 'on_blendshape_weight_changed', 'remove_module_blendshape'
-        ]
+        }
         
-        for method_name in required_methods:
-            if hasattr(HairQCMainWindow, method_name):
-                print(f"  ✅ Method '{method_name}' exists")
-            else:
-                print(f"  ❌ Method '{method_name}' missing")
-                return False
+        missing_methods = required_methods - set(dir(HairQCMainWindow))
+        if missing_methods:
+            print(f"  ❌ Missing methods: {sorted(missing_methods)}")
+            return False
         
         print("✅ All required module UI methods exist")
         return True
@@ -155,17 +190,24 @@ def test_ui_integration():
     except Exception as e:
         print(f"❌ UI integration test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
-def test_module_creation():
-    """Test module creation functionality"""
+@buffered_output
+def test_module_creation(data_manager=None):
+    """Test module creation functionality
+    
+    Args:
+        data_manager: Already refreshed DataManager shared by run_all_tests
+    """
     print("\nTesting Module Creation...")
     
     try:
-        from hair_qc_tool.managers import DataManager
+        if _IMPORT_ERROR is not None:
+            raise ImportError(str(_IMPORT_ERROR)) from _IMPORT_ERROR
         
-        data_manager = DataManager()
+        if data_manager is None:
+            data_manager = DataManager()
         
         # Load a group first
         groups = data_manager.get_groups()
@@ -177,9 +219,8 @@ def test_module_creation():
         success, message = data_manager.load_group(test_group)
         
         if success:
-            # Test creating a module (use timestamp to avoid conflicts)
-            import time
-            test_module_name = f"test_module_{int(time.time())}"
+            # Test creating a module (random suffix avoids name conflicts)
+            test_module_name = f"test_module_{secrets.token_hex(4)}"
             
             print(f"Creating test module: {test_module_name}")
             success, message = data_manager.create_module(test_module_name, "crown")
@@ -205,29 +246,44 @@ def test_module_creation():
     except Exception as e:
         print(f"❌ Module creation test failed: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 def run_all_tests():
     """Run all Module Management tests"""
-    print("="*60)
+    print(_HR)
     print("Hair QC Tool - Module Management Test")
-    print("="*60)
+    print(_HR)
     
     results = []
     
+    # Share one refreshed DataManager so the USD directory is scanned once;
+    # each test loads the group it works on, so no state leaks between them
+    data_manager = None
+    if _IMPORT_ERROR is None:
+        data_manager = DataManager()
+        success, message = data_manager.refresh_all_data()
+        print(f"DataManager refresh: {success} - {message}")
+    
     # Test individual managers and functionality
-    results.append(test_module_manager())
-    results.append(test_data_manager_modules())
-    results.append(test_ui_integration())
-    results.append(test_module_creation())
+    tests = [
+        test_module_manager,
+        functools.partial(test_data_manager_modules, data_manager),
+        test_ui_integration,
+        functools.partial(test_module_creation, data_manager),
+    ]
+    for test in tests:
+        result = test()
+        results.append(result)
+        if not result and FAILFAST:
+            break
     
-    print("\n" + "="*60)
+    print(f"\n{_HR}")
     print("Test Results Summary")
-    print("="*60)
+    print(_HR)
     
-    passed = sum(results)
-    total = len(results)
+    passed = results.count(True)
+    total = len(tests)
     
     print(f"Tests passed: {passed}/{total}")
     
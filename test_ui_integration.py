@@ -2,6 +2,7 @@
 Test if the UI integration is working with the new module management
 """
 
+import secrets
 import sys
 from pathlib import Path
 
@@ -10,11 +11,15 @@ project_path = Path(__file__).parent
 if str(project_path) not in sys.path:
     sys.path.insert(0, str(project_path))
 
+from script_helpers import SHOW_TRACEBACKS
+
+_HR = "=" * 60
+
 def test_ui_integration():
     """Test the UI integration without Maya"""
-    print("="*60)
+    print(_HR)
     print("TEST: UI Integration (Module Management)")
-    print("="*60)
+    print(_HR)
     
     try:
         # Test that we can import and create the data manager
@@ -44,8 +49,7 @@ def test_ui_integration():
                 print(f"✅ Available modules: {modules}")
                 
                 # Test creating a module (like the UI does)
-                import time
-                test_module_name = f"ui_test_module_{int(time.time())}"
+                test_module_name = f"ui_test_module_{secrets.token_hex(4)}"
                 test_module_type = "tail"
                 
                 print(f"✅ Creating module: {test_module_name} (type: {test_module_type})")
@@ -76,9 +80,10 @@ def test_ui_integration():
             print("❌ No groups available")
     
     except Exception as e:
-        print(f"❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Test failed with error: {type(e).__name__}: {e}")
+        if SHOW_TRACEBACKS:
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     test_ui_integration()
\ No newline at end of file